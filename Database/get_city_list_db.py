@@ -2,6 +2,8 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy import Column, Integer, String, Index
+from sqlalchemy import column, literal_column, select, table, text
+from sqlalchemy.exc import OperationalError
 
 
 # Database URL (SQLite)
@@ -27,16 +29,71 @@ Base = declarative_base()
 class CityMetricsQuery(Base):
     __tablename__ = "city_metrics"
 
-    id = Column(Integer, primary_key=True, index=True)
-    city = Column(String, index=True)
+    id = Column(Integer, primary_key=True)
+    city = Column(String)
     state_code = Column(String)
     state_name = Column(String, index=True)
 
+    # Leading column city also covers lookups on city alone; substring
+    # search goes through city_search instead
     __table_args__ = (
         Index("idx_city_state", "city", "state_name"),
     )
 
 
+# FTS5 trigram index over the city list, so that substring (ILIKE '%q%')
+# searches don't have to scan every row. It is an external-content table:
+# rebuild it whenever city_metrics is reloaded. State codes are left out,
+# two-letter codes never contain a trigram.
+city_search = table("city_search", column("rowid"))
+
+# The trigram tokenizer cannot match queries shorter than one trigram
+TRIGRAM_MIN_LENGTH = 3
+
+# Every state_code is a two-letter code
+STATE_CODE_LENGTH = 2
+
+
+def create_search_index():
+    """
+    Create and populate the city_search index if it does not exist yet.
+    Returns False when the SQLite build has no FTS5 trigram support.
+    """
+    try:
+        with engine.begin() as conn:
+            exists = conn.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE name = 'city_search'"
+            )).first()
+            if not exists:
+                conn.execute(text(
+                    "CREATE VIRTUAL TABLE city_search USING fts5("
+                    "city, state_name, content='city_metrics', "
+                    "content_rowid='id', tokenize='trigram')"
+                ))
+                conn.execute(text(
+                    "INSERT INTO city_search(city_search) VALUES ('rebuild')"
+                ))
+    except OperationalError as e:
+        print(f"City search index unavailable, falling back to scans: {e}")
+        return False
+    return True
+
+
+search_index_available = create_search_index()
+
+
+def search_city_ids(q: str):
+    """
+    Subquery of the ids of cities whose city or state name contains q
+    (case-insensitive), served by the trigram index.
+    """
+    phrase = '"' + q.replace('"', '""') + '"'
+    return select(city_search.c.rowid).where(
+        literal_column("city_search").op("MATCH")(
+            "{city state_name}: " + phrase)
+    )
+
+
 # Dependency for getting the database session
 def get_city_list_db():
     db = SessionLocal()
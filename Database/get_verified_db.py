@@ -7,10 +7,16 @@ import os
 SUPABASE_URL = os.getenv("SUPABASE_DB_URL")
 
 # Create the database engine
+# Endpoints run in FastAPI's threadpool (40 threads by default), so at most 40
+# sessions per worker are checked out at once; pool_size + max_overflow matches
+# that. Keep workers * (pool_size + max_overflow) below Postgres max_connections.
 engine = create_engine(
     SUPABASE_URL,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=20,
+    max_overflow=20,
+    # Replace connections before the server or pooler drops idle ones
+    pool_recycle=1800,
+    pool_pre_ping=True,
 )
 
 # Configure the session maker
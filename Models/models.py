@@ -9,10 +9,11 @@ class CityMetrics(Base):
     id = Column(Integer, primary_key=True, index=True)
     
     # Identification
-    city = Column(String, index=True)
+    city = Column(String)
     state_code = Column(String, index=True)
     state_name = Column(String, index=True)
-    search_id = Column(Integer, index=True)
+    # Id of the city in the city list, every comparison looks cities up by it
+    search_id = Column(Integer, unique=True, index=True)
 
     # Housing Availability
     home_price = Column(Float)  # Adjusted for numeric data
@@ -46,7 +47,8 @@ class CityMetrics(Base):
     created_at = Column(DateTime, default=datetime.now)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
 
-    # Define composite index for optimized search
+    # Define composite index for optimized search, it also serves lookups
+    # on city alone
     __table_args__ = (
         Index("idx_city_state", "city", "state_name"),
     )
@@ -1,15 +1,26 @@
+from dotenv import load_dotenv
+
+# Load .env before importing anything that reads its settings at import time
+load_dotenv()
+
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from dotenv import load_dotenv
-import os
-import openai
+from fastapi.responses import ORJSONResponse
 from routers.app import api_router
+from utils.http_client import http_client
+from utils.openai_client import client, async_client
 
-load_dotenv()
 
-openai.api_key = os.getenv("OPENAI_API_KEY")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    http_client.close()
+    client.close()
+    await async_client.close()
+
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -1,6 +1,5 @@
 import argparse
 import os
-import openai
 from langchain.schema.document import Document
 from utils.get_embedding_function import get_embedding_function
 from langchain_chroma import Chroma
@@ -9,7 +8,6 @@ from utils.load_documents import load_documents, load_news
 from utils.constants import BLOGS_COLLECTION, NEWS_COLLECTION
 
 load_dotenv()
-openai.api_key = os.getenv("OPENAI_API_KEY")
 
 # Constants
 CHROMA_PATH = "chroma"
@@ -1,19 +1,25 @@
-import openai
+import json
+import sys
 from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.future import select
 from sqlalchemy import or_, case
-from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import Optional, List
+from functools import lru_cache
 from utils.query_data import query_rag
 from utils.city_score import get_city_score
 from utils.fetch_news import fetch_news
-from utils.City_Data.get_city_data import get_city_data
+from utils.City_Data.get_city_data import get_cities_data
 from Database.get_news_db import get_news_db, News
 from Database.get_verified_db import get_verified_db
-from Database.get_city_list_db import get_city_list_db, CityMetricsQuery
+from Database.get_city_list_db import (
+    SessionLocal as CityListSession, CityMetricsQuery, search_city_ids,
+    search_index_available, TRIGRAM_MIN_LENGTH, STATE_CODE_LENGTH,
+)
 from utils.constants import MAIN_URL
+from utils.openai_client import async_client
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -27,32 +33,65 @@ from Models.models import CityMetrics
 api_router = APIRouter()
 
 
+@lru_cache(maxsize=4096)
+def search_cities(q: str):
+    """
+    Cities matching a (stripped) search term. Typeahead requests repeat the
+    same prefixes constantly and the city list is static, so results are kept
+    in an LRU cache; call search_cities.cache_clear() after reloading it.
+    """
+    search_query = f"%{q}%"
+    if search_index_available and len(q) >= TRIGRAM_MIN_LENGTH:
+        search_filter = CityMetricsQuery.id.in_(search_city_ids(q))
+    else:
+        conditions = [
+            CityMetricsQuery.city.ilike(search_query),
+            CityMetricsQuery.state_name.ilike(search_query),
+        ]
+        # A longer term can never be contained in a two-letter state code
+        if len(q) <= STATE_CODE_LENGTH:
+            conditions.append(CityMetricsQuery.state_code.ilike(search_query))
+        search_filter = or_(*conditions)
+
+    with CityListSession() as db:
+        cities = db.query(
+            CityMetricsQuery.id,
+            CityMetricsQuery.city,
+            CityMetricsQuery.state_name,
+            CityMetricsQuery.state_code,
+        ).filter(
+            search_filter
+        ).order_by(
+            case(
+                (CityMetricsQuery.city.ilike(search_query), 1),
+                else_=2
+            )
+        ).limit(20).all()
+
+    # Only 51 distinct states: intern them so the cached rows share one copy
+    return tuple(
+        {
+            "id": city.id,
+            "city": city.city,
+            "state_name": sys.intern(city.state_name),
+            "state_code": sys.intern(city.state_code),
+            "value": f"{city.city}, {city.state_code}",
+        }
+        for city in cities
+    )
+
+
 @api_router.get("/get-cities-list")
-async def get_items_list(
+def get_items_list(
     q: str = Query(
         None, description="City name and state name to search"
     ),
-    db: Session = Depends(get_city_list_db),
 ):
     print(q)
     if not q or not q.strip():
         raise HTTPException(status_code=400, detail="Search term is required.")
 
-    search_query = f"%{q.strip()}%"
-    query = db.query(CityMetricsQuery).filter(
-        or_(
-            CityMetricsQuery.city.ilike(search_query),
-            CityMetricsQuery.state_name.ilike(search_query),
-            CityMetricsQuery.state_code.ilike(search_query)
-        )
-    ).order_by(
-        case(
-            (CityMetricsQuery.city.ilike(search_query), 1),
-            else_=2
-        )
-    ).limit(20)
-
-    cities = query.all()
+    cities = search_cities(q.strip())
 
     if not cities:
         return {
@@ -62,16 +101,7 @@ async def get_items_list(
         }
 
     return {
-        "results": [
-            {
-                "id": city.id,
-                "city": city.city,
-                "state_name": city.state_name,
-                "state_code": city.state_code,
-                "value": f"{city.city}, {city.state_code}",
-            }
-            for city in cities
-        ],
+        "results": list(cities),
         "success": True,
     }
 
@@ -90,13 +120,14 @@ class QueryRequest(BaseModel):
 
 
 @api_router.post("/comparison")
-async def handle_query(request: QueryRequest, db: Session = Depends(get_verified_db)):
+def handle_query(request: QueryRequest, db: Session = Depends(get_verified_db)):
     """
     Compare metrics between two cities.
-    """
 
-    def model_to_dict(instance):
-        return {c.name: getattr(instance, c.name) for c in instance.__table__.columns}
+    Declared as a plain def: the database session and the RAG/OpenAI calls are
+    all blocking, so FastAPI runs this in its threadpool instead of on the
+    event loop.
+    """
 
     def add_units(city_data):
         city = {
@@ -141,17 +172,8 @@ async def handle_query(request: QueryRequest, db: Session = Depends(get_verified
         "description": f"A move from {request.from_city.city} to {request.to_city.city} covers a significant distance. This move would bring substantial changes in cost of living, climate, and urban environment.",
     }
 
-    city_1_data = get_city_data(request.from_city, db)
-    city_2_data = get_city_data(request.to_city, db)
-    # db.commit()
-    # db.refresh(city_1_data)
-    # db.refresh(city_2_data)
-
-    city_1_data = model_to_dict(city_1_data)
-    city_2_data = model_to_dict(city_2_data)
-
-    city_1_str = add_units(city_1_data)
-    city_2_str = add_units(city_2_data)
+    city_1_data, city_2_data = get_cities_data(
+        request.from_city, request.to_city, db)
 
     # Check if city data exists
     if not city_1_data or not city_2_data:
@@ -159,6 +181,9 @@ async def handle_query(request: QueryRequest, db: Session = Depends(get_verified
             status_code=404, detail="City data not found for one or both cities."
         )
 
+    city_1_str = add_units(city_1_data)
+    city_2_str = add_units(city_2_data)
+
     return {
         **result,
         "city_1": city_1_str,
@@ -169,11 +194,11 @@ async def handle_query(request: QueryRequest, db: Session = Depends(get_verified
 
 
 @api_router.get("/similar_posts")
-async def get_similar_posts(
+def get_similar_posts(
     city: Optional[str] = Query(
         None, description="Search term to find similar posts"
     ),
-    db: AsyncSession = Depends(get_news_db),
+    db: Session = Depends(get_news_db),
 ):
     results = db.execute(select(News).filter(
         News.name.ilike(f"%{city}%"))).scalars().all()[0]
@@ -204,30 +229,50 @@ class ChatRequest(BaseModel):
     city: Optional[str] = None
 
 
-def chat_with_gpt(messages: List[Message], city: str):
-    """Send a prompt to OpenAI GPT-4 model and return the response."""
+@lru_cache(maxsize=1024)
+def get_system_prompt(city: str):
+    """Build the chatbot system prompt for a city."""
+    return f"You are an AI chatbot who is expert on LGBTQ+ related topics. Provide quick, concise, and helpful answers not more than 300 chars about LGBTQ+ resources, events, and information in {city}."
+
+
+async def chat_with_gpt(messages: List[Message], city: str):
+    """Send a prompt to OpenAI GPT-4 model and return the streamed response."""
     try:
-        system_prompt = f"You are an AI chatbot who is expert on LGBTQ+ related topics. Provide quick, concise, and helpful answers not more than 300 chars about LGBTQ+ resources, events, and information in {city}."
+        system_prompt = get_system_prompt(city)
 
-        messages = [{"role": "system", "content": system_prompt}] + messages
+        messages = [{"role": "system", "content": system_prompt}] + [
+            message.model_dump() for message in messages
+        ]
 
-        response = openai.chat.completions.create(
+        return await async_client.chat.completions.create(
             model="gpt-4o-mini",
             messages=messages,
+            stream=True,
         )
-        return response.choices[0].message.content
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error: {e}")
 
 
+async def stream_chat(response):
+    """Relay completion deltas as server-sent events as soon as they arrive."""
+    try:
+        async for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield f"data: {json.dumps({'content': chunk.choices[0].delta.content})}\n\n"
+    except Exception as e:
+        # Headers are already sent, so report the failure in-band
+        yield f"data: {json.dumps({'error': f'Error: {e}'})}\n\n"
+    yield "data: [DONE]\n\n"
+
+
 @api_router.post("/chat")
-def chatbot(request: ChatRequest):
-    """Endpoint to interact with the city chatbot."""
+async def chatbot(request: ChatRequest):
+    """Endpoint to interact with the city chatbot, streamed as text/event-stream."""
     if not request.messages:
         raise HTTPException(status_code=400, detail="Prompt cannot be empty.")
 
-    response = chat_with_gpt(request.messages, request.city)
-    return {"response": response}
+    response = await chat_with_gpt(request.messages, request.city)
+    return StreamingResponse(stream_chat(response), media_type="text/event-stream")
 
 
 # Define your request model
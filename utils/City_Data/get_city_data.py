@@ -6,6 +6,8 @@ from openai import OpenAI
 import os
 import json
 from utils.constants import PERPLEXITY_MODEL
+from utils.city_score import METRIC_ORDER
+from utils.openai_client import client
 from datetime import datetime
 
 system_prompt_for_city = """
@@ -72,7 +74,6 @@ Follow these guidelines:
 """
 
 
-client = OpenAI()
 perplexity_client = OpenAI(api_key=os.getenv(
     "PERPLEXITY_API_KEY"), base_url="https://api.perplexity.ai")
 
@@ -185,3 +186,29 @@ def get_city_data(city_details: CityDetails, db: Session):
     #     db.refresh(city_data)
 
     return city_data
+
+
+# Columns read by a comparison: the city identity plus every scored metric
+COMPARE_COLS = (
+    CityMetrics.search_id,
+    CityMetrics.city,
+    CityMetrics.state_code,
+    CityMetrics.state_name,
+    *(getattr(CityMetrics, field) for field in METRIC_ORDER),
+)
+
+
+def get_cities_data(from_city: CityDetails, to_city: CityDetails, db: Session):
+    """
+    Get the data of both cities of a comparison in a single database round-trip,
+    as mappings of only the columns in COMPARE_COLS. Comparing a city with
+    itself returns the same mapping twice.
+    """
+
+    search_ids = list({from_city.id, to_city.id})
+    rows = db.execute(
+        select(*COMPARE_COLS).where(CityMetrics.search_id.in_(search_ids))
+    ).mappings().all()
+
+    by_search_id = {row["search_id"]: row for row in rows}
+    return by_search_id.get(from_city.id), by_search_id.get(to_city.id)
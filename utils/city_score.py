@@ -1,13 +1,66 @@
+import numpy as np
+
 max_percentage = 99
 min_percentage = 55
 
+# (field, higher_is_better) pairs for every scoring category.
+CATEGORY_FIELDS = {
+    "housing_availability": (
+        ("home_price",                False),
+        ("property_tax",              False),
+        ("home_appreciation_rate",    True),
+        ("price_per_square_foot",     False),
+    ),
+    "quality_of_life": (
+        ("education",             True),
+        ("healthcare_fitness",    True),
+        ("weather_grade",         True),
+        ("air_quality_index",     True),
+        ("commute_transit_score", True),
+        ("accessibility",         True),
+        ("culture_entertainment", True),
+    ),
+    "job_market_strength": (
+        ("unemployment_rate",       False),
+        ("recent_job_growth",       True),
+        ("future_job_growth_index", True),
+        ("median_household_income", True),
+    ),
+    "living_affordability": (
+        ("state_income_tax",    False),
+        ("utilities",           False),
+        ("food_groceries",      False),
+        ("sales_tax",           False),
+        ("transportation_cost", False),
+    ),
+}
+
+# Flattened metric layout shared by every vector built below.
+METRIC_ORDER = [field for fields in CATEGORY_FIELDS.values() for field, _ in fields]
+HIGHER_BETTER_MASK = np.array(
+    [higher for fields in CATEGORY_FIELDS.values() for _, higher in fields],
+    dtype=bool,
+)
+
+
+def _category_slices():
+    slices, start = {}, 0
+    for category, fields in CATEGORY_FIELDS.items():
+        slices[category] = slice(start, start + len(fields))
+        start += len(fields)
+    return slices
+
+
+CATEGORY_SLICES = _category_slices()
+
+
 def clamp_value(val, lower=min_percentage, upper=max_percentage):
     """Clamp a final score into [55, 99]."""
-    return max(lower, min(upper, val))
+    return np.clip(val, lower, upper)
 
 def clamp_ratio(ratio, lower=0.5, upper=2.0):
     """Clamp a ratio into [0.5, 2.0]."""
-    return max(lower, min(upper, ratio))
+    return np.clip(ratio, lower, upper)
 
 def linear_transform(ratio):
     """
@@ -20,91 +73,60 @@ def linear_transform(ratio):
     intercept = 77 - slope
     return intercept + slope * ratio
 
-def get_ratio(origin_val, destination_val, higher_is_better=True):
+def to_vec(city):
+    """Pull the scoring metrics of a city dict into a vector in METRIC_ORDER."""
+    return np.fromiter(
+        (city[field] for field in METRIC_ORDER),
+        dtype=np.float64,
+        count=len(METRIC_ORDER),
+    )
+
+def get_ratios(origin_vals, destination_vals):
     """
-    Returns a ratio that is >1 if the destination is 'better' based on direction:
+    Element-wise version of the per-field ratio, over the last axis in METRIC_ORDER:
       - If higher_is_better=True:  ratio = (destination_val / origin_val)
       - If higher_is_better=False: ratio = (origin_val / destination_val)
 
-    Then clamps it to [0.5, 2.0].
+    Then clamps it to [0.5, 2.0]. A zero origin gives 2.0, a zero destination
+    gives 0.5 and both zero gives 1.0.
     """
-    if origin_val == 0 and destination_val == 0:
-        return 1.0
-    if origin_val == 0:
-        return 2.0
-    if destination_val == 0:
-        return 0.5
-
-    if higher_is_better:
-        ratio = destination_val / origin_val
-    else:
-        ratio = origin_val / destination_val
-
-    return clamp_ratio(ratio)
-
-def compute_category_score(origin, destination, fields_config):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = np.where(
+            HIGHER_BETTER_MASK,
+            destination_vals / origin_vals,
+            origin_vals / destination_vals,
+        )
+    ratios = clamp_ratio(ratios)
+
+    origin_zero = origin_vals == 0
+    destination_zero = destination_vals == 0
+    ratios = np.where(destination_zero, 0.5, ratios)
+    ratios = np.where(origin_zero, 2.0, ratios)
+    return np.where(origin_zero & destination_zero, 1.0, ratios)
+
+def compute_category_scores(ratios):
     """
-    Given a list of dicts describing the fields for one category, compute:
-      1) The ratio for each field (considering higher_is_better or not).
-      2) Average the ratios.
-      3) Convert that average ratio to a [55..99] score via linear_transform + clamp.
+    Average the ratios of each category, then convert each average to a
+    [55..99] score via linear_transform + clamp. Works on a single ratio
+    vector or a stack of them (one row per comparison).
     """
-    ratios = []
-    for field_info in fields_config:
-        field_name = field_info['field']
-        higher_is_better = field_info['higher_is_better']
-
-        orig_val = origin[field_name]
-        dest_val = destination[field_name]
-
-        ratio = get_ratio(orig_val, dest_val, higher_is_better)
-        ratios.append(ratio)
-
-    avg_ratio = sum(ratios) / len(ratios)
-    score = linear_transform(avg_ratio)
-    return clamp_value(score)
+    return {
+        category: clamp_value(linear_transform(ratios[..., fields].mean(axis=-1)))
+        for category, fields in CATEGORY_SLICES.items()
+    }
 
-def get_city_score(origin, destination):
+def score_ratios(ratios):
     """
-    Compare two cities using straightforward average-of-ratios logic for
-    each category, then produce an overall city score.
+    Turn field ratios into the four category scores plus the overall city
+    score. Accepts one ratio vector or a stack of them, so many comparisons
+    can be scored in a single vectorized pass.
     """
+    scores = compute_category_scores(ratios)
 
-    category_configs = {
-        "housing_availability": [
-            {"field": "home_price",                "higher_is_better": False},
-            {"field": "property_tax",              "higher_is_better": False},
-            {"field": "home_appreciation_rate",    "higher_is_better": True},
-            {"field": "price_per_square_foot",     "higher_is_better": False},
-        ],
-        "quality_of_life": [
-            {"field": "education",             "higher_is_better": True},
-            {"field": "healthcare_fitness",    "higher_is_better": True},
-            {"field": "weather_grade",         "higher_is_better": True},
-            {"field": "air_quality_index",     "higher_is_better": True},
-            {"field": "commute_transit_score", "higher_is_better": True},
-            {"field": "accessibility",         "higher_is_better": True},
-            {"field": "culture_entertainment", "higher_is_better": True},
-        ],
-        "job_market_strength": [
-            {"field": "unemployment_rate",       "higher_is_better": False},
-            {"field": "recent_job_growth",       "higher_is_better": True},
-            {"field": "future_job_growth_index", "higher_is_better": True},
-            {"field": "median_household_income", "higher_is_better": True},
-        ],
-        "living_affordability": [
-            {"field": "state_income_tax",    "higher_is_better": False},
-            {"field": "utilities",           "higher_is_better": False},
-            {"field": "food_groceries",      "higher_is_better": False},
-            {"field": "sales_tax",           "higher_is_better": False},
-            {"field": "transportation_cost", "higher_is_better": False},
-        ],
-    }
-
-    housing_score = compute_category_score(origin, destination, category_configs["housing_availability"])
-    qol_score = compute_category_score(origin, destination, category_configs["quality_of_life"])
-    job_score = compute_category_score(origin, destination, category_configs["job_market_strength"])
-    living_score = compute_category_score(origin, destination, category_configs["living_affordability"])
+    housing_score = scores["housing_availability"]
+    qol_score = scores["quality_of_life"]
+    job_score = scores["job_market_strength"]
+    living_score = scores["living_affordability"]
 
     overall_city_score = (
         housing_score + qol_score + job_score + living_score
@@ -112,9 +134,47 @@ def get_city_score(origin, destination):
     overall_city_score = clamp_value(overall_city_score)
 
     return {
-        "housing_affordability":  round(housing_score, 2),
-        "quality_of_life":        round(qol_score, 2),
-        "job_market_strength":    round(job_score, 2),
-        "living_affordability":   round(living_score, 2),
-        "overall_city_score":     round(overall_city_score, 2),
+        "housing_affordability":  housing_score,
+        "quality_of_life":        qol_score,
+        "job_market_strength":    job_score,
+        "living_affordability":   living_score,
+        "overall_city_score":     overall_city_score,
+    }
+
+# Every ratio of a city against itself is 1.0, so its score is a constant
+IDENTITY_CITY_SCORE = {
+    name: round(float(score), 2)
+    for name, score in score_ratios(np.ones(len(METRIC_ORDER))).items()
+}
+
+def get_city_score(origin, destination):
+    """
+    Compare two cities using straightforward average-of-ratios logic for
+    each category, then produce an overall city score. Comparing a city's
+    data with itself returns IDENTITY_CITY_SCORE without any math.
+    """
+    if origin is destination:
+        return dict(IDENTITY_CITY_SCORE)
+
+    ratios = get_ratios(to_vec(origin), to_vec(destination))
+    scores = score_ratios(ratios)
+    return {name: round(float(score), 2) for name, score in scores.items()}
+
+def get_city_scores(origin, destinations):
+    """
+    Bulk version of get_city_score: compare one origin city against many
+    destinations at once and return one score dict per destination.
+    """
+    if not destinations:
+        return []
+
+    destination_vals = np.vstack([to_vec(city) for city in destinations])
+    scores = score_ratios(get_ratios(to_vec(origin), destination_vals))
+    rounded = {
+        name: [round(value, 2) for value in score.tolist()]
+        for name, score in scores.items()
     }
+    return [
+        {name: values[i] for name, values in rounded.items()}
+        for i in range(len(destinations))
+    ]
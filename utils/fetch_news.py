@@ -1,12 +1,32 @@
 from bs4 import BeautifulSoup
+from cachetools import TTLCache
+from threading import Lock
 from utils.constants import MAIN_URL
-import requests
+from utils.http_client import http_client
+
+# News and realtor listings change slowly, keep parsed pages for 15 minutes
+news_cache = TTLCache(maxsize=1024, ttl=900)
+news_cache_lock = Lock()
 
 
 def fetch_news(query):
+    with news_cache_lock:
+        cached = news_cache.get(query)
+    if cached is not None:
+        return cached
+
+    news = scrape_news(query)
+    # Failed fetches return [] and are retried on the next request
+    if news:
+        with news_cache_lock:
+            news_cache[query] = news
+    return news
+
+
+def scrape_news(query):
 
     URL = f"{MAIN_URL}/{query}".replace("\\", "/")
-    realtors_page = requests.get(URL)
+    realtors_page = http_client.get(URL)
 
     try:
         if realtors_page.status_code == 200:
@@ -1,21 +1,31 @@
-import requests
 from bs4 import BeautifulSoup
 from utils.constants import MAIN_URL
+from utils.http_client import http_client
 
 
 def fetch_blogs(blog_ids: list[str]) -> dict:
     """
     Fetch blogs from the database using the provided document IDs.
+    All posts come back from one request, with only the fields filter_blog reads.
     """
 
-    blogs = []
-    for blog_id in blog_ids:
-        blog = requests.get(
-            MAIN_URL + "/blog/wp-json/wp/v2/posts/" + str(blog_id))
-        if blog.status_code == 200:
-            blogs.append(blog.json())
-
-    return blogs
+    # An empty include would return the latest posts instead of none
+    if not blog_ids:
+        return []
+
+    response = http_client.get(
+        MAIN_URL + "/blog/wp-json/wp/v2/posts",
+        params={
+            "include": ",".join(str(blog_id) for blog_id in blog_ids),
+            "orderby": "include",
+            "per_page": len(blog_ids),
+            "_fields": "id,title,content",
+        },
+    )
+    if response.status_code != 200:
+        return []
+
+    return response.json()
 
 
 def filter_blog(blog: dict) -> dict:
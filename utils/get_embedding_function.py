@@ -1,5 +1,8 @@
+from functools import lru_cache
 from langchain_openai import OpenAIEmbeddings
 
+# Built once: the embeddings object holds its own OpenAI clients
+@lru_cache(maxsize=None)
 def get_embedding_function():
     embeddings = OpenAIEmbeddings(model="text-embedding-ada-002")
     return embeddings
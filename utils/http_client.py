@@ -0,0 +1,10 @@
+import httpx
+
+
+# Shared client so repeated requests to the same host reuse pooled
+# keep-alive connections instead of opening a new one every time
+http_client = httpx.Client(
+    timeout=10.0,
+    follow_redirects=True,
+    limits=httpx.Limits(max_keepalive_connections=32),
+)
@@ -0,0 +1,8 @@
+import os
+from openai import AsyncOpenAI, OpenAI
+
+
+# Created once and shared by every module, so OpenAI calls reuse the clients'
+# pooled keep-alive connections instead of opening new ones per request
+client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+async_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
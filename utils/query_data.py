@@ -1,11 +1,11 @@
 from langchain_chroma import Chroma
 from langchain.prompts import ChatPromptTemplate
-from openai import OpenAI
 from utils.get_embedding_function import get_embedding_function
 from utils.get_blogs import fetch_blogs, filter_blogs
 from pydantic import BaseModel
 from typing import List
 from utils.constants import CHROMA_PATH, BLOGS_COLLECTION
+from utils.openai_client import client
 
 
 class Resource(BaseModel):
@@ -74,8 +74,6 @@ You are tasked with finding and listing resources related to LGBTQ+ support serv
 **Answer:**
 """
 
-client = OpenAI()
-
 
 def format_file_reference(reference):
     if reference is None: